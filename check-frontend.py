@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 SERVER_URL = "http://localhost:8086"
 
+# Shared session so every request reuses the same keep-alive connection
+SESSION = requests.Session()
+# Retry transient failures (e.g. the server still starting up) with a short backoff
+SESSION.mount("http://", HTTPAdapter(max_retries=Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)))
+
 print("Checking which files are visible from the frontend...")
 
 def make_request(url, method="GET", params=None):
@@ -11,7 +24,7 @@ def make_request(url, method="GET", params=None):
     
     try:
         if method == "GET":
-            response = requests.get(url, params=params)
+            response = SESSION.get(url, params=params)
         else:
             return None
         
@@ -19,18 +32,22 @@ def make_request(url, method="GET", params=None):
             if response.headers.get('Content-Type', '').startswith('application/json'):
                 return response.json()
             else:
-                return response.text[:100] + "..."
+                return response.content[:100].decode("utf-8", "replace") + "..."
         else:
             return f"Error: {response.status_code} - {response.text}"
     except Exception as e:
         return f"Exception: {str(e)}"
 
+def print_file_list(files):
+    # Emit the whole listing in a single write instead of one print per file
+    if files:
+        print("\n".join(f"- {file.get('name')} (ID: {file.get('id')})" for file in files))
+
 # List files at root
 print("Files at root level:")
 root_files = make_request(f"{SERVER_URL}/api/files")
 if isinstance(root_files, list):
-    for file in root_files:
-        print(f"- {file.get('name')} (ID: {file.get('id')})")
+    print_file_list(root_files)
 else:
     print(f"Error: {root_files}")
 
@@ -38,8 +55,7 @@ else:
 print("\nFiles in folder-storage:1:")
 folder_files = make_request(f"{SERVER_URL}/api/files", params={"folder_id": "folder-storage:1"})
 if isinstance(folder_files, list):
-    for file in folder_files:
-        print(f"- {file.get('name')} (ID: {file.get('id')})")
+    print_file_list(folder_files)
 else:
     print(f"Error: {folder_files}")
 